@@ -1,5 +1,6 @@
 """Support for Template Humidifier."""
 import logging
+import sys
 
 import voluptuous as vol
 from typing import Any
@@ -97,10 +98,52 @@ DEFAULT_SWITCH_STATE = STATE_OFF
 MIN_HUMIDITY = 40
 MAX_HUMIDITY = 80
 
+_DEFAULT_INITIAL_STATE = DEFAULT_SWITCH_STATE == STATE_ON
+
 DOMAIN = "humidifier_template"
 
 _LOGGER = logging.getLogger(__name__)
 
+_BAD_STATES: frozenset[str] = frozenset((STATE_UNKNOWN, STATE_UNAVAILABLE))
+
+
+def _is_bad_state(value: Any) -> bool:
+    """Return True if a rendered template result is unknown or unavailable."""
+    # Results may be unhashable native types such as lists.
+    return isinstance(value, str) and value in _BAD_STATES
+
+
+_MISSING = object()
+
+_DEVICE_INFO_KEYMAP = (
+    (CONF_MANUFACTURER, ATTR_MANUFACTURER),
+    (CONF_MODEL, ATTR_MODEL),
+    (CONF_NAME, ATTR_NAME),
+    (CONF_HW_VERSION, ATTR_HW_VERSION),
+    (CONF_SERIAL_NUMBER, ATTR_SERIAL_NUMBER),
+    (CONF_SW_VERSION, ATTR_SW_VERSION),
+    (CONF_SUGGESTED_AREA, ATTR_SUGGESTED_AREA),
+    (CONF_CONFIGURATION_URL, ATTR_CONFIGURATION_URL),
+)
+
+_TRUTHY_STATES = frozenset(("true", "True", "TRUE", STATE_ON, "On", "ON"))
+_FALSY_STATES = frozenset(("false", "False", "FALSE", STATE_OFF, "Off", "OFF"))
+
+
+def _parse_state_string(state: str) -> bool:
+    """Parse a rendered state string, lower-casing only unusual spellings."""
+    if state in _TRUTHY_STATES:
+        return True
+    if state in _FALSY_STATES:
+        return False
+    return state.lower() in _TRUTHY_STATES
+
+
+_STATE_PARSERS = {
+    bool: bool,
+    str: _parse_state_string,
+}
+
 
 def validate_device_has_at_least_one_identifier(value: ConfigType) -> ConfigType:
     """Validate that a device info entry has at least one identifying value."""
@@ -146,7 +189,7 @@ PLATFORM_SCHEMA = cv.PLATFORM_SCHEMA.extend(
     vol.Optional(CONF_ACTION_TEMPLATE): cv.template,
     vol.Optional(CONF_MODE_TEMPLATE): cv.template,
     vol.Optional(CONF_MODE_LIST_TEMPLATE): cv.template,
-    vol.Optional(CONF_TYPE, default=DEFAULT_TYPE): vol.All(cv.string, vol.In(TYPES)),
+    vol.Optional(CONF_TYPE, default=DEFAULT_TYPE): vol.In(TYPES),
     vol.Optional(
         CONF_MODE_LIST,
         default=[
@@ -180,45 +223,57 @@ def device_info_from_specifications(
     if not specifications:
         return None
 
+    identifiers = specifications.get(CONF_IDENTIFIERS)
+    connections = specifications.get(CONF_CONNECTIONS)
     info = DeviceInfo(
-        identifiers={(DOMAIN, id_) for id_ in specifications[CONF_IDENTIFIERS]},
-        connections={
-            (conn_[0], conn_[1]) for conn_ in specifications[CONF_CONNECTIONS]
-        },
+        identifiers={(DOMAIN, id_) for id_ in identifiers} if identifiers else set(),
+        connections={tuple(conn_) for conn_ in connections} if connections else set(),
     )
 
-    if CONF_MANUFACTURER in specifications:
-        info[ATTR_MANUFACTURER] = specifications[CONF_MANUFACTURER]
-
-    if CONF_MODEL in specifications:
-        info[ATTR_MODEL] = specifications[CONF_MODEL]
-
-    if CONF_NAME in specifications:
-        info[ATTR_NAME] = specifications[CONF_NAME]
-
-    if CONF_HW_VERSION in specifications:
-        info[ATTR_HW_VERSION] = specifications[CONF_HW_VERSION]
-
-    if CONF_SERIAL_NUMBER in specifications:
-        info[ATTR_SERIAL_NUMBER] = specifications[CONF_SERIAL_NUMBER]
-
-    if CONF_SW_VERSION in specifications:
-        info[ATTR_SW_VERSION] = specifications[CONF_SW_VERSION]
+    for conf, attr in _DEVICE_INFO_KEYMAP:
+        value = specifications.get(conf, _MISSING)
+        if value is not _MISSING:
+            info[attr] = value
 
     if CONF_VIA_DEVICE in specifications:
         info[ATTR_VIA_DEVICE] = (DOMAIN, specifications[CONF_VIA_DEVICE])
 
-    if CONF_SUGGESTED_AREA in specifications:
-        info[ATTR_SUGGESTED_AREA] = specifications[CONF_SUGGESTED_AREA]
-
-    if CONF_CONFIGURATION_URL in specifications:
-        info[ATTR_CONFIGURATION_URL] = specifications[CONF_CONFIGURATION_URL]
-
     return info
 
 
 class TemplateHumidifier(TemplateEntity, HumidifierEntity, RestoreEntity):
 
+    # Only attributes owned by this class; _attr_* defaults live on the
+    # base classes and a slot would hide them until first assignment.
+    __slots__ = (
+        "_config",
+        "_state_template",
+        "_current_humidity_template",
+        "_target_humidity_template",
+        "_action_template",
+        "_mode_template",
+        "_mode_list_template",
+        "_switch_id",
+        "_switch_domain",
+        "_current_humidity",
+        "_state",
+        "_active_action",
+        "_target_humidity",
+        "_set_mode_action",
+        "_set_mode_script",
+        "_set_target_humidity_action",
+        "_set_target_humidity_script",
+    )
+
+    _TEMPLATE_BINDINGS = (
+        ("_state", "_state_template", "_update_state"),
+        ("_mode", "_mode_template", "_update_mode"),
+        ("_mode_list", "_mode_list_template", "_update_mode_list"),
+        ("_current_humidity", "_current_humidity_template", "_update_current_humidity"),
+        ("_target_humidity", "_target_humidity_template", "_update_target_humidity"),
+        ("_action", "_action_template", "_update_action"),
+    )
+
     def __init__(self, hass: HomeAssistant, config: ConfigType):
         """Initialize the humidifier."""
         super().__init__(
@@ -232,9 +287,10 @@ class TemplateHumidifier(TemplateEntity, HumidifierEntity, RestoreEntity):
             ENTITY_ID_FORMAT, config[CONF_NAME], hass=hass
         )
         self._config = config
+        name_id = config[CONF_NAME].lower().replace(" ", "_")
         self._attr_unique_id = config.get(
             CONF_UNIQUE_ID,
-            f"template_humidifier_{config[CONF_NAME].lower().replace(" ", "_")}"
+            f"template_humidifier_{name_id}"
         )
         self._attr_name = config[CONF_NAME]
         self._attr_min_humidity = config.get(CONF_HUMIDITY_MIN, MIN_HUMIDITY)
@@ -246,43 +302,45 @@ class TemplateHumidifier(TemplateEntity, HumidifierEntity, RestoreEntity):
         self._mode_template = config.get(CONF_MODE_TEMPLATE, None)
         self._mode_list_template = config.get(CONF_MODE_LIST_TEMPLATE, None)
         self._switch_id = config.get(CONF_SWITCH_ID, None)
-        self._set_mode_action = config.get(CONF_SET_MODE_ACTION, None)
-        self._set_target_humidity_action = config.get(CONF_SET_TARGET_HUMIDITY_ACTION, None)
+        self._switch_domain = (
+            FAN_DOMAIN
+            if self._switch_id and self._switch_id.startswith(f"{FAN_DOMAIN}.")
+            else SWITCH_DOMAIN
+        )
 
         self._current_humidity = DEFAULT_HUMIDITY
 
-        self._state = DEFAULT_SWITCH_STATE == STATE_ON
-        self._attr_device_class = HumidifierDeviceClass.DEHUMIDIFIER
-        if self._config[CONF_TYPE] == HUMIDIFIER_TYPE:
-            self._attr_device_class = HumidifierDeviceClass.HUMIDIFIER
-
-        # To cheack if the switch state change if fired by the platform
-        self._self_changed_switch = False
+        self._state = _DEFAULT_INITIAL_STATE
+        is_humidifier = config[CONF_TYPE] == HUMIDIFIER_TYPE
+        self._attr_device_class = (
+            HumidifierDeviceClass.HUMIDIFIER
+            if is_humidifier
+            else HumidifierDeviceClass.DEHUMIDIFIER
+        )
+        self._active_action = (
+            HumidifierAction.HUMIDIFYING
+            if is_humidifier
+            else HumidifierAction.DRYING
+        )
 
         self._target_humidity = DEFAULT_HUMIDITY
-        if self._config[CONF_MODE_LIST]:
+        self._attr_available_modes = None
+        self._attr_mode = None
+        if modes := config[CONF_MODE_LIST]:
             self._attr_supported_features = HumidifierEntityFeature.MODES
-            self._attr_available_modes = config[CONF_MODE_LIST]
+            self._attr_available_modes = [
+                sys.intern(str(mode)) if isinstance(mode, str) else mode
+                for mode in modes
+            ]
             self._attr_mode = MODE_NORMAL
         if self._config.get(CONF_DEVICE):
             self._attr_device_info = device_info_from_specifications(self._config.get(CONF_DEVICE))
 
-        self._available = True
-
-        # set script variables
+        # set script variables, scripts are built on first use
+        self._set_mode_action = config.get(CONF_SET_MODE_ACTION)
         self._set_mode_script = None
-        set_mode_action = config.get(CONF_SET_MODE_ACTION)
-        if set_mode_action:
-            self._set_mode_script = Script(
-                hass, set_mode_action, self._attr_name, DOMAIN
-            )
-
+        self._set_target_humidity_action = config.get(CONF_SET_TARGET_HUMIDITY_ACTION)
         self._set_target_humidity_script = None
-        set_target_humidity_action = config.get(CONF_SET_TARGET_HUMIDITY_ACTION)
-        if set_target_humidity_action:
-            self._set_target_humidity_script = Script(
-                hass, set_target_humidity_action, self._attr_name, DOMAIN
-            )
 
     async def async_added_to_hass(self):
         """Run when entity about to be added."""
@@ -292,81 +350,27 @@ class TemplateHumidifier(TemplateEntity, HumidifierEntity, RestoreEntity):
         previous_state = await self.async_get_last_state()
         if previous_state is not None:
             self._state = previous_state.state
+            attributes = previous_state.attributes
 
-            if mode := previous_state.attributes.get(
-                ATTR_MODE, MODE_NORMAL
-            ):
+            if (mode := attributes.get(ATTR_MODE)) is not None:
                 self._attr_mode = mode
 
-            if humidity := previous_state.attributes.get(
-                ATTR_HUMIDITY, DEFAULT_HUMIDITY
-            ):
-                self._target_temp = humidity
-
-            if current_temperature := previous_state.attributes.get(
-                ATTR_CURRENT_HUMIDITY
-            ):
-                self._current_temp = current_temperature
+            if (humidity := attributes.get(ATTR_HUMIDITY)) is not None:
+                self._target_humidity = humidity
 
-            if humidity := previous_state.attributes.get(
-                ATTR_CURRENT_HUMIDITY
-            ):
-                self._current_humidity = humidity
+            if (current_humidity := attributes.get(ATTR_CURRENT_HUMIDITY)) is not None:
+                self._current_humidity = current_humidity
 
         # register templates
-        if self._state_template:
-            self.add_template_attribute(
-                "_state",
-                self._state_template,
-                None,
-                self._update_state,
-                none_on_template_error=True,
-            )
-
-        if self._mode_template:
-            self.add_template_attribute(
-                "_mode",
-                self._mode_template,
-                None,
-                self._update_mode,
-                none_on_template_error=True,
-            )
-
-        if self._mode_list_template:
-            self.add_template_attribute(
-                "_mode_list",
-                self._mode_list_template,
-                None,
-                self._update_mode_list,
-                none_on_template_error=True,
-            )
-
-        if self._current_humidity_template:
-            self.add_template_attribute(
-                "_current_humidity",
-                self._current_humidity_template,
-                None,
-                self._update_current_humidity,
-                none_on_template_error=True,
-            )
-
-        if self._target_humidity_template:
-            self.add_template_attribute(
-                "_target_humidity",
-                self._target_humidity_template,
-                None,
-                self._update_target_humidity,
-                none_on_template_error=True,
-            )
-
-        if self._action_template:
-            self.add_template_attribute(
-                "_action",
-                self._action_template,
-                None,
-                self._update_action,
-                none_on_template_error=True,
-            )
+        for attribute, template_attr, callback_attr in self._TEMPLATE_BINDINGS:
+            if template := getattr(self, template_attr):
+                self.add_template_attribute(
+                    attribute,
+                    template,
+                    None,
+                    getattr(self, callback_attr),
+                    none_on_template_error=True,
+                )
 
     @property
     def current_humidity(self) -> int | None:
@@ -387,6 +391,11 @@ class TemplateHumidifier(TemplateEntity, HumidifierEntity, RestoreEntity):
         """Set target humidity."""
         self._target_humidity = humidity
 
+        if self._set_target_humidity_script is None and self._set_target_humidity_action:
+            self._set_target_humidity_script = Script(
+                self.hass, self._set_target_humidity_action, self._attr_name, DOMAIN
+            )
+
         if self._set_target_humidity_script is not None:
             await self._set_target_humidity_script.async_run(
                 run_variables={ATTR_HUMIDITY: humidity}, context=self._context
@@ -398,6 +407,11 @@ class TemplateHumidifier(TemplateEntity, HumidifierEntity, RestoreEntity):
             self._attr_mode = mode  # always optimistic
             self.async_write_ha_state()
 
+        if self._set_mode_script is None and self._set_mode_action:
+            self._set_mode_script = Script(
+                self.hass, self._set_mode_action, self._attr_name, DOMAIN
+            )
+
         if self._set_mode_script is not None:
             await self._set_mode_script.async_run(
                 run_variables={ATTR_MODE: mode}, context=self._context
@@ -408,104 +422,96 @@ class TemplateHumidifier(TemplateEntity, HumidifierEntity, RestoreEntity):
         self._state = True
 
         if self._switch_id is not None:
-            if "fan" in self._switch_id:
-                await self.hass.services.async_call(
-                    FAN_DOMAIN,
-                    SERVICE_TURN_ON,
-                    {"entity_id": self._switch_id}
-                )
-            else:
-                await self.hass.services.async_call(
-                    SWITCH_DOMAIN,
-                    SERVICE_TURN_ON,
-                    {"entity_id": self._switch_id}
-                )
+            await self.hass.services.async_call(
+                self._switch_domain,
+                SERVICE_TURN_ON,
+                {"entity_id": self._switch_id}
+            )
 
     async def async_turn_off(self) -> None:
         """Turn the device off."""
         self._state = False
 
         if self._switch_id is not None:
-            if "fan" in self._switch_id:
-                await self.hass.services.async_call(
-                    FAN_DOMAIN,
-                    SERVICE_TURN_OFF,
-                    {"entity_id": self._switch_id}
-                )
-            else:
-                await self.hass.services.async_call(
-                    SWITCH_DOMAIN,
-                    SERVICE_TURN_OFF,
-                    {"entity_id": self._switch_id}
-                )
+            await self.hass.services.async_call(
+                self._switch_domain,
+                SERVICE_TURN_OFF,
+                {"entity_id": self._switch_id}
+            )
 
     @callback
     def _update_state(self, state):
-        self._state = False
-        if state not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
-            try:
-                if isinstance(state, TemplateError):
-                    self._state = None
-                    return
-
-                if isinstance(state, bool):
-                    self._state = state
-                    return
-
-                if isinstance(state, str):
-                    self._state = state.lower() in ("true", STATE_ON)
-                    return
-
-            except ValueError:
-                _LOGGER.error("Could not parse state from %s", state)
-            self._state = False
+        new_state = False
+        if not _is_bad_state(state):
+            if isinstance(state, TemplateError):
+                new_state = None
+            else:
+                parser = _STATE_PARSERS.get(type(state))
+                if parser is not None:
+                    new_state = parser(state)
+        if new_state == self._state:
+            return
+        self._state = new_state
 
     @callback
     def _update_mode(self, mode):
-        if mode not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
-            try:
-                self._attr_mode = mode
-            except ValueError:
-                _LOGGER.error("Could not parse mode from %s", mode)
+        if not _is_bad_state(mode):
+            if mode == self._attr_mode:
+                return
+            self._attr_mode = mode
 
     @callback
     def _update_mode_list(self, mode_list):
-        if mode_list not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+        if not _is_bad_state(mode_list):
+            if not mode_list:
+                return
             try:
-                self._attr_supported_features = HumidifierEntityFeature.MODES
-                self._attr_available_modes = mode_list
-                self._attr_mode = mode_list[0]
-            except ValueError:
+                mode = mode_list[0]
+            except (TypeError, IndexError, KeyError):
                 _LOGGER.error("Could not parse mode from %s", mode_list)
+                return
+            if (
+                mode_list == self._attr_available_modes
+                and mode == self._attr_mode
+            ):
+                return
+            self._attr_supported_features = HumidifierEntityFeature.MODES
+            self._attr_available_modes = mode_list
+            self._attr_mode = mode
 
     @callback
     def _update_current_humidity(self, humidity):
-        if humidity not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+        if not _is_bad_state(humidity):
             try:
-                self._current_humidity = int(humidity)
+                current_humidity = int(humidity)
             except ValueError:
                 _LOGGER.error("Could not parse humidity from %s", humidity)
+                return
+            if current_humidity == self._current_humidity:
+                return
+            self._current_humidity = current_humidity
 
     @callback
     def _update_target_humidity(self, humidity):
-        if humidity not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+        if not _is_bad_state(humidity):
             try:
-                self._target_humidity = int(humidity)
+                target_humidity = int(humidity)
             except ValueError:
                 _LOGGER.error("Could not parse humidity from %s", humidity)
+                return
+            if target_humidity == self._target_humidity:
+                return
+            self._target_humidity = target_humidity
 
     @callback
     def _update_action(self, action):
-        if action not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
-            try:
-                if not self._state:
-                    self._attr_action = HumidifierAction.OFF
-                else:
-                    self._attr_action = HumidifierAction.HUMIDIFYING
-                    if self._config.get(CONF_TYPE, HUMIDIFIER_TYPE) == DEHUMIDIFIER_TYPE:
-                        self._attr_action = HumidifierAction.DRYING
-                    if action == "fan":
-                        self._attr_action = HumidifierAction.IDLE
-            except ValueError:
-                _LOGGER.error("Could not parse action from %s", action)
-
+        if not _is_bad_state(action):
+            if not self._state:
+                new_action = HumidifierAction.OFF
+            elif action == "fan":
+                new_action = HumidifierAction.IDLE
+            else:
+                new_action = self._active_action
+            if new_action == self._attr_action:
+                return
+            self._attr_action = new_action
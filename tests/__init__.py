@@ -0,0 +1 @@
+"""Tests for the Template Humidifier integration."""
@@ -0,0 +1,11 @@
+"""Fixtures for Template Humidifier tests.
+
+The hass fixture and helpers come from pytest-homeassistant-custom-component.
+"""
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Allow loading custom_components in every test."""
+    yield
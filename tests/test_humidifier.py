@@ -0,0 +1,63 @@
+"""Tests for the Template Humidifier platform."""
+from homeassistant.components.humidifier import (
+    ATTR_AVAILABLE_MODES,
+    DOMAIN as HUMIDIFIER_DOMAIN,
+)
+from homeassistant.const import ATTR_MODE, STATE_ON
+from homeassistant.core import HomeAssistant, State
+from homeassistant.setup import async_setup_component
+from homeassistant.util.yaml.objects import NodeStrClass
+from pytest_homeassistant_custom_component.common import mock_restore_cache
+
+from custom_components.humidifier_template.humidifier import (
+    CONF_MODE_LIST,
+    DOMAIN,
+    PLATFORM_SCHEMA,
+    TemplateHumidifier,
+)
+
+
+async def test_yaml_mode_list(hass: HomeAssistant) -> None:
+    """Test modes loaded from YAML as NodeStrClass build the entity."""
+    config = PLATFORM_SCHEMA(
+        {
+            "platform": DOMAIN,
+            "name": "test",
+            CONF_MODE_LIST: [NodeStrClass("auto"), NodeStrClass("sleep")],
+        }
+    )
+
+    humidifier = TemplateHumidifier(hass, config)
+
+    assert humidifier.available_modes == ["auto", "sleep"]
+    assert all(type(mode) is str for mode in humidifier.available_modes)
+
+
+async def test_restore_without_mode_and_empty_modes(hass: HomeAssistant) -> None:
+    """Test mode templates still update after restoring a state without mode."""
+    mock_restore_cache(hass, (State("humidifier.test", STATE_ON, {}),))
+
+    assert await async_setup_component(
+        hass,
+        HUMIDIFIER_DOMAIN,
+        {
+            HUMIDIFIER_DOMAIN: {
+                "platform": DOMAIN,
+                "name": "test",
+                CONF_MODE_LIST: [],
+                "mode_list_template": "{{ ['auto', 'sleep'] }}",
+                "mode_template": "{{ states('sensor.mode') }}",
+            }
+        },
+    )
+    await hass.async_block_till_done()
+
+    state = hass.states.get("humidifier.test")
+    assert state.attributes[ATTR_AVAILABLE_MODES] == ["auto", "sleep"]
+    assert state.attributes[ATTR_MODE] == "auto"
+
+    hass.states.async_set("sensor.mode", "sleep")
+    await hass.async_block_till_done()
+
+    state = hass.states.get("humidifier.test")
+    assert state.attributes[ATTR_MODE] == "sleep"